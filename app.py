@@ -11,7 +11,7 @@ import streamlit as st
 import plotly.express as px
 import pandas as pd
 
-from utils.data_loader import load_zhvi_data, get_states, filter_data, add_yoy_change, add_state_codes, load_mortgage_rates
+from utils.data_loader import load_zhvi_data, get_states, filter_data, downsample_for_plot, add_state_codes, load_mortgage_rates
 
 
 
@@ -27,12 +27,108 @@ st.markdown("Explore US median home value trends using [Zillow Research Data](ht
 
 
 # ── Load data ──
-@st.cache_data
+@st.cache_resource
 def get_data():
-    """Load data once and cache it so the app stays fast."""
+    """Load data once and cache it so the app stays fast.
+
+    cache_resource (not cache_data) so reruns reuse the same DataFrame
+    object without re-hashing or copying it. Treat the result as
+    read-only: filters must return new frames, never mutate this one.
+    """
     return load_zhvi_data()
 
 
+# ── Chart builders ──
+# Rebuilding Plotly figures (and their JSON serialization) on every rerun
+# is wasted work when the filters haven't changed the data feeding a
+# chart. Each builder is memoized with a cheap frame fingerprint instead
+# of letting st.cache_data hash full column contents.
+
+
+def _plot_frame_key(df: pd.DataFrame):
+    """Cheap cache key for plot frames: row count, date bounds, states."""
+    states = tuple(df["state"].unique()) if "state" in df.columns else ()
+    return (len(df), df["date"].min(), df["date"].max(), states)
+
+
+@st.cache_data(hash_funcs={pd.DataFrame: _plot_frame_key})
+def build_trend_chart(df):
+    fig = px.line(
+        downsample_for_plot(df),
+        x="date",
+        y="median_home_value",
+        color="state",
+        labels={
+            "date": "Date",
+            "median_home_value": "Median Home Value ($)",
+            "state": "State",
+        },
+        template="plotly_white",
+        render_mode="webgl",  # GPU rendering; SVG path layout chokes on many states
+    )
+    fig.update_layout(
+        hovermode="x unified",
+        yaxis_tickprefix="$",
+        yaxis_tickformat=",",
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        height=500,
+    )
+    return fig
+
+
+@st.cache_data(hash_funcs={pd.DataFrame: _plot_frame_key})
+def build_bar_chart(latest_data):
+    fig = px.bar(
+        latest_data.sort_values("median_home_value", ascending=True),
+        x="median_home_value",
+        y="state",
+        orientation="h",
+        labels={
+            "median_home_value": "Median Home Value ($)",
+            "state": "",
+        },
+        template="plotly_white",
+        color="median_home_value",
+        color_continuous_scale="Blues",
+    )
+    fig.update_layout(
+        xaxis_tickprefix="$",
+        xaxis_tickformat=",",
+        showlegend=False,
+        coloraxis_showscale=False,
+        height=max(300, len(latest_data) * 40),
+    )
+    return fig
+
+
+@st.cache_data(hash_funcs={pd.DataFrame: _plot_frame_key})
+def build_yoy_chart(df):
+    return px.line(
+        df,
+        x="date",
+        y="yoy_change",
+        color="state",
+        labels={
+            "date": "Date",
+            "yoy_change": "Year-over-Year Change (%)",
+            "state": "State",
+        },
+        template="plotly_white",
+        render_mode="webgl",
+    )
+
+
+@st.cache_data(hash_funcs={pd.DataFrame: _plot_frame_key})
+def build_map_chart(latest_data):
+    return px.choropleth(
+        add_state_codes(latest_data),
+        locations="state_code",
+        locationmode="USA-states",
+        color="median_home_value",
+        scope="usa",
+    )
+
+
 try:
     df = get_data()
 except FileNotFoundError:
@@ -82,112 +178,67 @@ if filtered_df.empty:
 
 st.subheader("Median Home Value Over Time")
 
-fig_trend = px.line(
-    filtered_df,
-    x="date",
-    y="median_home_value",
-    color="state",
-    labels={
-        "date": "Date",
-        "median_home_value": "Median Home Value ($)",
-        "state": "State",
-    },
-    template="plotly_white",
-)
-
-fig_trend.update_layout(
-    hovermode="x unified",
-    yaxis_tickprefix="$",
-    yaxis_tickformat=",",
-    legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-    height=500,
-)
-
-st.plotly_chart(fig_trend, use_container_width=True)
+st.plotly_chart(build_trend_chart(filtered_df), use_container_width=True)
 
 
 # ── Summary metrics ──
 st.subheader("Current Snapshot")
 
-latest_date = filtered_df["date"].max()
-latest_data = filtered_df[filtered_df["date"] == latest_date]
-
-# Show metric cards in columns
-cols = st.columns(min(len(latest_data), 4))
-
-for i, (_, row) in enumerate(latest_data.iterrows()):
-    col = cols[i % len(cols)]
+# Each state's rows end with its newest month, so tail(1) per group gets
+# the latest row per state without scanning the date column — and states
+# whose series end early still get a card instead of dropping out.
+latest_data = filtered_df.groupby("state", sort=False).tail(1)
+latest_date = latest_data["date"].max()
+
+# Year-over-year change for every state at once: grab each state's last
+# row at or before one year ago, then join it back in a single merge
+# instead of re-filtering the frame per metric card.
+one_year_ago = latest_date - pd.DateOffset(years=1)
+prev = (
+    filtered_df[filtered_df["date"] <= one_year_ago]
+    .groupby("state", as_index=False)
+    .tail(1)
+)
+snapshot = latest_data.merge(
+    prev[["state", "median_home_value"]],
+    on="state",
+    how="left",
+    suffixes=("", "_prev"),
+)
+snapshot["yoy_change"] = (
+    (snapshot["median_home_value"] - snapshot["median_home_value_prev"])
+    / snapshot["median_home_value_prev"]
+    * 100
+)
 
-    # Calculate year-over-year change
-    one_year_ago = latest_date - pd.DateOffset(years=1)
-    prev = filtered_df[
-        (filtered_df["state"] == row["state"])
-        & (filtered_df["date"] == filtered_df[filtered_df["date"] <= one_year_ago]["date"].max())
-    ]
+# Show metric cards in columns; plain NumPy arrays zip together without
+# any per-row pandas object construction
+cols = st.columns(min(len(snapshot), 4))
 
-    yoy_change = None
-    if not prev.empty:
-        prev_val = prev["median_home_value"].iloc[0]
-        yoy_change = (row["median_home_value"] - prev_val) / prev_val * 100
+states = snapshot["state"].to_numpy()
+values = snapshot["median_home_value"].to_numpy()
+yoys = snapshot["yoy_change"].to_numpy()
 
-    col.metric(
-        label=row["state"],
-        value=f"${row['median_home_value']:,.0f}",
-        delta=f"{yoy_change:+.1f}% YoY" if yoy_change is not None else None,
+for i, (state, value, yoy) in enumerate(zip(states, values, yoys)):
+    cols[i % len(cols)].metric(
+        label=state,
+        value=f"${value:,.0f}",
+        delta=f"{yoy:+.1f}% YoY" if pd.notna(yoy) else None,
     )
 
 
 # ── Bar chart: latest values comparison ───
 st.subheader("State Comparison (Latest Month)")
 
-fig_bar = px.bar(
-    latest_data.sort_values("median_home_value", ascending=True),
-    x="median_home_value",
-    y="state",
-    orientation="h",
-    labels={
-        "median_home_value": "Median Home Value ($)",
-        "state": "",
-    },
-    template="plotly_white",
-    color="median_home_value",
-    color_continuous_scale="Blues",
-)
+st.plotly_chart(build_bar_chart(latest_data), use_container_width=True)
 
-fig_bar.update_layout(
-    xaxis_tickprefix="$",
-    xaxis_tickformat=",",
-    showlegend=False,
-    coloraxis_showscale=False,
-    height=max(300, len(latest_data) * 40),
-)
-yoy_df = add_yoy_change(filtered_df)
+# yoy_change is precomputed on the full series at load time, so the
+# filtered frame already carries it — nothing to recompute here.
 st.subheader("Year-over-Year Price Change (%)")
-fig_yoy= px.line(
-    yoy_df,
-    x="date",
-    y="yoy_change",
-    color="state",
-    labels={
-        "date": "Date",
-        "yoy_change": "Year-over-Year Change (%)",
-        "state": "State",
-    },
-    template="plotly_white",
- )
-st.plotly_chart(fig_yoy, use_container_width=True)
-
-map_data = add_state_codes(latest_data)
-st.subheader("Median Home Value by State")
-fig_map = px.choropleth(
-    map_data,
-    locations= "state_code",
-    locationmode="USA-states",
-    color="median_home_value",
-    scope="usa",
-)
+st.plotly_chart(build_yoy_chart(filtered_df), use_container_width=True)
 
-st.plotly_chart(fig_map, use_container_width=True)
+st.subheader("Median Home Value by State")
+st.plotly_chart(build_map_chart(latest_data), use_container_width=True)
 
 mortgage_data = load_mortgage_rates()
 st.subheader("30-Year Fixed Mortgage Rate (%)")
@@ -10,8 +10,13 @@ Usage:
 """
 
 import os
+import sys
 import requests
-import pandas as pd
+import pyarrow.csv
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.data_loader import reshape_zhvi
 
 
 # Zillow Home Value Index - All Homes, Smoothed, Seasonally Adjusted (by State)
@@ -32,7 +37,7 @@ def download_zhvi():
     print(f"URL: {ZHVI_URL}")
 
     try:
-        response = requests.get(ZHVI_URL, timeout=30)
+        response = requests.get(ZHVI_URL, stream=True, timeout=30)
         response.raise_for_status()
     except requests.RequestException as e:
         print(f"\n❌ Download failed: {e}")
@@ -43,15 +48,26 @@ def download_zhvi():
         print("4. Save the CSV to the data/ folder as 'zhvi_by_state.csv'")
         return False
 
+    # Stream straight to disk — never holds the whole body in memory
     with open(output_path, "wb") as f:
-        f.write(response.content)
+        for chunk in response.iter_content(chunk_size=1 << 20):
+            f.write(chunk)
 
-    # Quick validation
-    df = pd.read_csv(output_path)
+    # Quick validation with pyarrow's multi-threaded CSV reader; the same
+    # parse feeds the Parquet preprocessing below, so the file is read once
+    table = pyarrow.csv.read_csv(output_path)
+    date_cols = sorted(c for c in table.column_names if c.startswith("20"))
     print(f"\n✅ Success! Saved to {output_path}")
-    print(f"   States: {len(df)}")
-    print(f"   Date columns: {len([c for c in df.columns if c.startswith('20')])}")
-    print(f"   Date range: {sorted([c for c in df.columns if c.startswith('20')])[0]} → {sorted([c for c in df.columns if c.startswith('20')])[-1]}")
+    print(f"   States: {table.num_rows}")
+    print(f"   Date columns: {len(date_cols)}")
+    print(f"   Date range: {date_cols[0]} → {date_cols[-1]}")
+
+    # Preprocess once: the dashboard reads this Parquet file directly,
+    # skipping the CSV parse + melt on every cold cache miss.
+    parquet_path = os.path.join(DATA_DIR, "zhvi_by_state.parquet")
+    df_long = reshape_zhvi(table.to_pandas())
+    df_long.to_parquet(parquet_path, engine="pyarrow", compression="zstd")
+    print(f"   Preprocessed long format saved to {parquet_path}")
 
     return True
 
@@ -6,10 +6,16 @@ into a clean, long-format DataFrame ready for visualization.
 """
 
 import os
+import numpy as np
 import pandas as pd
 import requests
 import streamlit as st
 
+try:
+    from tsdownsample import MinMaxLTTBDownsampler
+except ImportError:  # optional — the NumPy LTTB fallback is used instead
+    MinMaxLTTBDownsampler = None
+
 DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
 STATE_CODES = {"Alabama": "AL",
     "Alaska": "AK",
@@ -71,60 +77,173 @@ STATE_CODES = {"Alabama": "AL",
     }
 
 def add_state_codes(df: pd.DataFrame) -> pd.DataFrame:
-    df = df.copy()
-    df["state_code"] = df["state"].map(STATE_CODES)
-    return df
+    # assign returns a new frame sharing the existing columns' buffers,
+    # so no deep copy of the input is made.
+    state = df["state"]
+    if isinstance(state.dtype, pd.CategoricalDtype) and all(
+        c in STATE_CODES for c in state.cat.categories
+    ):
+        # Remap the 52-entry categories array and reuse the existing
+        # integer codes, instead of a per-row dict lookup.
+        codes = pd.Categorical.from_codes(
+            state.cat.codes,
+            categories=[STATE_CODES[c] for c in state.cat.categories],
+        )
+        return df.assign(state_code=codes)
+    return df.assign(state_code=state.map(STATE_CODES))
 
 
-def load_zhvi_data() -> pd.DataFrame:
+def reshape_zhvi(df: pd.DataFrame) -> pd.DataFrame:
     """
-    Load and reshape the Zillow Home Value Index data.
+    Reshape the raw wide-format ZHVI frame into long format.
 
     The raw CSV has one row per state and one column per month (wide format).
-    This function melts it into long format with columns:
+    This melts it into long format with columns:
         - state: State name
         - date: Month as a datetime
         - median_home_value: The ZHVI value in dollars
 
     Returns:
-        pd.DataFrame in long format, sorted by state and date.
+        pd.DataFrame in long format, one contiguous run of ascending
+        dates per state.
+    """
+    # Identify date columns (they look like "2000-01-31")
+    date_columns = [col for col in df.columns if col.startswith("20")]
+
+    # Reshape wide -> long directly in NumPy: parse the date headers once,
+    # pull the value block as one contiguous float array, then repeat/tile
+    # the labels. This avoids the object-dtype intermediates of df.melt.
+    dates = pd.to_datetime(date_columns)
+    values = df[date_columns].to_numpy(dtype="float64")  # N states x M months
+    n_states, n_months = values.shape
+
+    df_long = pd.DataFrame(
+        {
+            "state": np.repeat(df["RegionName"].to_numpy(), n_months),
+            "date": np.tile(dates.to_numpy(), n_states),
+            # float32 holds 7 significant digits — plenty for dollar
+            # values, at half the memory traffic of float64
+            "median_home_value": values.reshape(-1).astype("float32"),
+        }
+    )
+
+    # Drop missing months via a mask on the float column (no object dtype).
+    # The repeat/tile construction already leaves rows state-major with
+    # ascending dates per state, so no sort is needed; the filter path
+    # verifies per-state date order before relying on it.
+    df_long = df_long[~np.isnan(df_long["median_home_value"].to_numpy())]
+    df_long = df_long.reset_index(drop=True)
+
+    return df_long
+
+
+def load_zhvi_data() -> pd.DataFrame:
+    """
+    Load the Zillow Home Value Index data in long format.
+
+    Prefers the preprocessed Parquet file written by the download script
+    (already long format, with native datetimes — no CSV parsing or melt
+    needed). Falls back to reshaping the raw wide CSV if only that exists.
+
+    Returns:
+        pd.DataFrame in long format — one contiguous run of ascending
+        dates per state — with the state column as a categorical dtype.
 
     Raises:
-        FileNotFoundError: If the data file hasn't been downloaded yet.
+        FileNotFoundError: If neither data file has been downloaded yet.
     """
-    filepath = os.path.join(DATA_DIR, "zhvi_by_state.csv")
+    parquet_path = os.path.join(DATA_DIR, "zhvi_by_state.parquet")
+    csv_path = os.path.join(DATA_DIR, "zhvi_by_state.csv")
 
-    if not os.path.exists(filepath):
+    if os.path.exists(parquet_path):
+        # Arrow-backed dtypes: no NumPy conversion on read, and nullable
+        # floats/timestamps stay compact. The state column is recast to
+        # categorical below either way.
+        df_long = pd.read_parquet(
+            parquet_path, engine="pyarrow", dtype_backend="pyarrow"
+        )
+    elif os.path.exists(csv_path):
+        df_long = reshape_zhvi(pd.read_csv(csv_path))
+    else:
         raise FileNotFoundError(
             "Data file not found. Run 'python scripts/download_data.py' first."
         )
 
-    df = pd.read_csv(filepath)
+    # Categorical states make downstream isin/groupby integer comparisons.
+    df_long["state"] = df_long["state"].astype("category")
 
-    # Identify date columns (they look like "2000-01-31")
-    date_columns = [col for col in df.columns if col.startswith("20")]
-    id_columns = ["RegionName"]  # State name
-
-    # Melt from wide to long format
-    df_long = df.melt(
-        id_vars=id_columns,
-        value_vars=date_columns,
-        var_name="date",
-        value_name="median_home_value",
-    )
+    # Resolve the sidebar's state list once here; categories are already
+    # sorted and unique.
+    df_long.attrs["states"] = df_long["state"].cat.categories.tolist()
 
-    # Clean up
-    df_long = df_long.rename(columns={"RegionName": "state"})
-    df_long["date"] = pd.to_datetime(df_long["date"])
-    df_long = df_long.dropna(subset=["median_home_value"])
-    df_long = df_long.sort_values(["state", "date"]).reset_index(drop=True)
+    # Year-over-year change, computed once here rather than per rerun.
+    # Rows are monthly and state-major, so "12 rows back" is the same
+    # month last year; null out comparisons that cross a state boundary.
+    df_long["yoy_change"] = df_long["median_home_value"].pct_change(periods=12) * 100
+    crosses_state = df_long["state"] != df_long["state"].shift(12)
+    df_long.loc[crosses_state, "yoy_change"] = np.nan
+
+    # Build the state -> row-positions table eagerly so even the first
+    # filter_data call takes the binary-search path without a groupby.
+    _state_positions(df_long)
 
     return df_long
 
 
+class _PositionIndex:
+    """
+    Holder for the cached state -> row positions mapping.
+
+    pandas propagates and compares df.attrs when frames are merged or
+    concatenated; a bare dict of NumPy arrays there makes that equality
+    check ambiguous. This wrapper compares by identity and survives
+    copies un-duplicated.
+    """
+
+    __slots__ = ("positions",)
+
+    def __init__(self, positions: dict | None):
+        self.positions = positions
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+def _state_positions(df: pd.DataFrame) -> dict | None:
+    """
+    Return a mapping of state -> row positions, computed once per frame.
+
+    The result is cached in ``df.attrs`` so repeated filter calls on the
+    cached base frame skip the groupby. Returns None when any state's
+    dates are out of order, in which case callers must fall back to a
+    boolean mask.
+    """
+    if "_state_positions" not in df.attrs:
+        positions = df.groupby("state", observed=True, sort=False).indices
+        dates = df["date"].to_numpy()
+        sorted_within_state = all(
+            (dates[idx][1:] >= dates[idx][:-1]).all() for idx in positions.values()
+        )
+        df.attrs["_state_positions"] = _PositionIndex(
+            positions if sorted_within_state else None
+        )
+    return df.attrs["_state_positions"].positions
+
+
 def get_states(df: pd.DataFrame) -> list[str]:
     """Return a sorted list of unique state names."""
-    return sorted(df["state"].unique().tolist())
+    # The loader resolves this once and stores it on the frame.
+    states = df.attrs.get("states")
+    if states is not None:
+        return states
+    state = df["state"]
+    if isinstance(state.dtype, pd.CategoricalDtype):
+        # Categories are already sorted and unique — no column scan needed.
+        return state.cat.categories.tolist()
+    return sorted(state.unique().tolist())
 
 
 def filter_data(
@@ -143,25 +262,106 @@ def filter_data(
         end_date: End date string. None means no upper bound.
 
     Returns:
-        Filtered DataFrame.
+        Filtered DataFrame (a new frame; the input is never mutated).
     """
-    filtered = df.copy()
+    start = pd.to_datetime(start_date) if start_date else None
+    end = pd.to_datetime(end_date) if end_date else None
+
+    # Fast path: each state's rows are stored as a run of ascending dates,
+    # so the date bounds become two binary searches per state instead of
+    # two full-length boolean masks.
+    positions = _state_positions(df)
+    if positions is not None:
+        dates = df["date"].to_numpy()
+        keys = states if states else positions.keys()
+        pieces = []
+        for state in keys:
+            idx = positions.get(state)
+            if idx is None:
+                continue
+            run_dates = dates[idx]
+            lo = run_dates.searchsorted(start.to_datetime64()) if start else 0
+            hi = (
+                run_dates.searchsorted(end.to_datetime64(), side="right")
+                if end
+                else len(idx)
+            )
+            if lo < hi:
+                pieces.append(idx[lo:hi])
+        if not pieces:
+            return df.iloc[:0]
+        # Sort so the result keeps the frame's row order, as a mask would.
+        return df.take(np.sort(np.concatenate(pieces)))
+
+    # Fallback: one combined mask and a single indexing pass.
+    mask = np.ones(len(df), dtype=bool)
 
     if states:
-        filtered = filtered[filtered["state"].isin(states)]
+        mask &= df["state"].isin(states).to_numpy()
 
-    if start_date:
-        filtered = filtered[filtered["date"] >= pd.to_datetime(start_date)]
+    if start:
+        mask &= (df["date"] >= start).to_numpy()
 
-    if end_date:
-        filtered = filtered[filtered["date"] <= pd.to_datetime(end_date)]
+    if end:
+        mask &= (df["date"] <= end).to_numpy()
 
-    return filtered
+    return df.loc[mask]
 
-def add_yoy_change(df: pd.DataFrame) -> pd.DataFrame:
-    df = df.copy()
-    df["yoy_change"] = df.groupby("state")["median_home_value"].pct_change(periods=12) * 100
-    return df
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Select n_out row indices via Largest-Triangle-Three-Buckets.
+
+    Pure-NumPy fallback for when tsdownsample isn't installed. Keeps the
+    first and last points and, per bucket, the point forming the largest
+    triangle with the previous pick and the next bucket's mean.
+    """
+    n = len(x)
+    edges = np.linspace(1, n - 1, n_out - 1, dtype=np.int64)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+    prev = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], max(edges[i + 1], edges[i] + 1)
+        nxt_hi = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[hi:nxt_hi].mean() if hi < nxt_hi else x[n - 1]
+        avg_y = y[hi:nxt_hi].mean() if hi < nxt_hi else y[n - 1]
+        area = np.abs(
+            (x[prev] - avg_x) * (y[lo:hi] - y[prev])
+            - (x[prev] - x[lo:hi]) * (avg_y - y[prev])
+        )
+        prev = lo + int(area.argmax())
+        indices[i + 1] = prev
+    return indices
+
+
+def downsample_for_plot(df: pd.DataFrame, max_points_per_state: int = 1000) -> pd.DataFrame:
+    """
+    Cap each state's series at max_points_per_state rows before plotting.
+
+    The chart canvas has far fewer pixels than a long multi-state
+    selection has points; MinMaxLTTB keeps the visual shape (peaks and
+    troughs) while cutting what Plotly has to serialize and render.
+    Frames already under the cap are returned unchanged.
+    """
+    pieces = []
+    changed = False
+    for _, group in df.groupby("state", observed=True, sort=False):
+        if len(group) <= max_points_per_state:
+            pieces.append(group)
+            continue
+        x = group["date"].to_numpy().astype("int64")
+        y = group["median_home_value"].to_numpy(dtype="float64")
+        if MinMaxLTTBDownsampler is not None:
+            idx = MinMaxLTTBDownsampler().downsample(x, y, n_out=max_points_per_state)
+        else:
+            idx = _lttb_indices(x.astype("float64"), y, max_points_per_state)
+        pieces.append(group.iloc[idx])
+        changed = True
+
+    if not changed:
+        return df
+    return pd.concat(pieces)
 
 
 def load_mortgage_rates()  -> pd.DataFrame: